@@ -2,22 +2,167 @@
 Data loading module for the backtesting framework.
 """
 
+import hashlib
+import logging
 import os
+import queue
+import threading
 import pandas as pd
 import numpy as np
+import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Union, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Union, Optional, Tuple
+
+try:
+    import pyarrow  # noqa: F401
+    from pyarrow import csv as pa_csv
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED_COLUMNS = frozenset(['open', 'high', 'low', 'close', 'volume'])
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _log_returns(close, period, out):
+        """
+        Fused log-return kernel over a (T, N) close matrix.
+
+        Computes log(close[t] / close[t - period]) in one pass per column,
+        avoiding the shifted, ratio, and log temporaries the equivalent
+        pandas expression allocates. No fastmath: the input legitimately
+        contains NaNs (missing bars) that must propagate, and fastmath
+        lets the compiler assume they don't exist.
+        """
+        rows, cols = close.shape
+        for j in range(cols):
+            for i in range(period):
+                out[i, j] = np.nan
+            for i in range(period, rows):
+                out[i, j] = np.log(close[i, j] / close[i - period, j])
+
+
+class DiskCache:
+    """
+    File-backed cache for downloaded price data.
+
+    Entries are parquet files keyed by an MD5 hash of the request
+    parameters, so repeated backtest runs read immutable historical bars
+    from disk instead of re-downloading them.
+    """
+
+    _warned_missing_pyarrow = False
+
+    def __init__(self, directory: str = '.cache/yf', ttl_days: int = 30):
+        """
+        Initialize the DiskCache.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory for cache files, by default '.cache/yf'
+        ttl_days : int, optional
+            Default time-to-live for entries in days, by default 30
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_days * 86400
+
+    def _path(self, key: Tuple) -> str:
+        """Return the cache file path for a key tuple."""
+        digest = hashlib.md5('|'.join(str(part) for part in key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.parquet")
+
+    def get(self, key: Tuple, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for a key, or None on miss/expiry.
+
+        Parameters
+        ----------
+        key : Tuple
+            Cache key, e.g. (symbol, start_date, end_date, interval)
+        max_age : float, optional
+            Maximum entry age in seconds, by default the cache TTL.
+            Pass float('inf') for entries that never expire
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            Cached DataFrame, or None if absent or older than max_age
+        """
+        if not _HAS_PYARROW:
+            return None
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        if max_age is None:
+            max_age = self.ttl_seconds
+        if datetime.now().timestamp() - os.path.getmtime(path) > max_age:
+            return None
+
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            return None
+
+    def set(self, key: Tuple, df: pd.DataFrame) -> None:
+        """
+        Store a DataFrame under a key.
+
+        Parameters
+        ----------
+        key : Tuple
+            Cache key, e.g. (symbol, start_date, end_date, interval)
+        df : pd.DataFrame
+            DataFrame to store
+        """
+        if not _HAS_PYARROW:
+            # Warn once per process; caching is skipped on every write and
+            # repeating that per symbol per load is just noise
+            if not DiskCache._warned_missing_pyarrow:
+                logger.warning("pyarrow is not installed; disk caching disabled")
+                DiskCache._warned_missing_pyarrow = True
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        df.to_parquet(self._path(key))
 
 
 class DataLoader:
     """
     Class for loading financial data from various sources.
     """
-    
+
     def __init__(self):
         """Initialize the DataLoader."""
         self.data = {}
+        self._cache = DiskCache()
+        self._returns_cache: Dict[Tuple[str, int, str], pd.Series] = {}
+
+        # Shared HTTP session so all yfinance requests reuse pooled
+        # TCP/TLS connections instead of handshaking per symbol
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+        # SoA view built by build_matrix: one contiguous (T, N) array per
+        # field, shared across symbols
+        self.matrix: Dict[str, np.ndarray] = {}
+        self.symbols: List[str] = []
+        self.timestamps = None
         
     def load_from_source(self, 
                          source: str, 
@@ -32,7 +177,7 @@ class DataLoader:
         Parameters
         ----------
         source : str
-            Data source ('yfinance', 'csv', 'excel')
+            Data source ('yfinance', 'csv', 'excel', 'parquet_cache')
         symbols : List[str]
             List of ticker symbols to load
         start_date : str
@@ -55,18 +200,24 @@ class DataLoader:
             return self._load_from_csv(symbols, **kwargs)
         elif source.lower() == 'excel':
             return self._load_from_excel(symbols, **kwargs)
+        elif source.lower() == 'parquet_cache':
+            return self._load_from_parquet_cache(symbols, **kwargs)
         else:
             raise ValueError(f"Unsupported data source: {source}")
     
-    def _load_from_yfinance(self, 
+    def _load_from_yfinance(self,
                            symbols: List[str],
                            start_date: str,
                            end_date: str,
                            interval: str = '1d',
+                           batch: bool = True,
+                           use_cache: bool = True,
+                           price_dtype=np.float32,
+                           max_workers: int = 16,
                            **kwargs) -> Dict[str, pd.DataFrame]:
         """
         Load data from Yahoo Finance.
-        
+
         Parameters
         ----------
         symbols : List[str]
@@ -77,51 +228,326 @@ class DataLoader:
             End date for data in format 'YYYY-MM-DD'
         interval : str, optional
             Data interval, by default '1d'
+        batch : bool, optional
+            Use multi-symbol yf.download requests, by default True.
+            When False, fetch per symbol via Ticker.history on a thread
+            pool (needed when per-ticker metadata is required)
+        use_cache : bool, optional
+            Serve and store downloads via the on-disk cache, by default True
+        price_dtype : optional
+            Dtype for price columns, by default np.float32; pass
+            np.float64 for numerically sensitive work
+        max_workers : int, optional
+            Thread count for the per-symbol fetch path, by default 16.
+            With max_workers=1 a single request is in flight at a time,
+            but the next download is still prefetched while the current
+            frame is normalized
         **kwargs : dict
             Additional keyword arguments for yfinance
-            
+
         Returns
         -------
         Dict[str, pd.DataFrame]
             Dictionary of DataFrames with symbols as keys
         """
         result = {}
-        for symbol in symbols:
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(start=start_date, end=end_date, interval=interval)
-            
-            # Ensure the DataFrame has the required columns
-            if 'Open' not in df.columns or 'Close' not in df.columns:
-                print(f"Warning: Missing required columns for symbol {symbol}")
-                continue
-                
-            # Rename columns to standardized format
-            df = df.rename(columns={
-                'Open': 'open',
-                'High': 'high',
-                'Low': 'low',
-                'Close': 'close',
-                'Volume': 'volume'
-            })
-            
-            result[symbol] = df
-            
+
+        # Fold the yfinance options into the cache key so calls that
+        # differ only in kwargs (e.g. auto_adjust) don't share an entry
+        extras = tuple(f"{name}={value}" for name, value in sorted(kwargs.items()))
+
+        to_fetch = list(symbols)
+        if use_cache:
+            # Bars for a fully elapsed date range are immutable, so cache
+            # hits for them never expire; open-ended ranges use the TTL
+            max_age = None
+            if pd.Timestamp(end_date) < pd.Timestamp.today().normalize():
+                max_age = float('inf')
+
+            to_fetch = []
+            for symbol in symbols:
+                cached = self._cache.get((symbol, start_date, end_date, interval) + extras, max_age)
+                if cached is not None:
+                    result[symbol] = cached
+                else:
+                    to_fetch.append(symbol)
+
+        if to_fetch:
+            if batch:
+                fetched = self._download_batched(to_fetch, start_date, end_date, interval, **kwargs)
+            elif max_workers > 1:
+                fetched = self._download_threaded(to_fetch, start_date, end_date, interval,
+                                                  max_workers=max_workers, **kwargs)
+            else:
+                fetched = self._download_pipelined(to_fetch, start_date, end_date, interval, **kwargs)
+
+            if use_cache:
+                for symbol, df in fetched.items():
+                    self._cache.set((symbol, start_date, end_date, interval) + extras, df)
+
+            result.update(fetched)
+
+        # Downcast after the cache round trip so entries stay full
+        # precision and a later price_dtype=np.float64 call isn't served
+        # float32 frames
+        for symbol in result:
+            result[symbol] = self._downcast_columns(result[symbol], price_dtype)
+
         self.data.update(result)
+        self._invalidate_returns_cache(result)
         return result
-    
-    def _load_from_csv(self, 
+
+    def _download_batched(self,
+                         symbols: List[str],
+                         start_date: str,
+                         end_date: str,
+                         interval: str = '1d',
+                         **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Download symbols from Yahoo Finance via multi-symbol yf.download.
+
+        Parameters
+        ----------
+        symbols : List[str]
+            List of ticker symbols to load
+        start_date : str
+            Start date for data in format 'YYYY-MM-DD'
+        end_date : str
+            End date for data in format 'YYYY-MM-DD'
+        interval : str, optional
+            Data interval, by default '1d'
+        **kwargs : dict
+            Additional keyword arguments for yf.download
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Dictionary of DataFrames with symbols as keys
+        """
+        result = {}
+
+        # yf.download defaults auto_adjust=False, unlike Ticker.history;
+        # match the history default so all fetch paths return adjusted
+        # closes with the same schema
+        kwargs.setdefault('auto_adjust', True)
+
+        # Download in batches of at most 20 symbols per request (Yahoo's URL
+        # limit) so N symbols cost N/20 HTTP round trips instead of N.
+        batch_size = 20
+        for group in [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]:
+            df = yf.download(tickers=group,
+                             start=start_date,
+                             end=end_date,
+                             interval=interval,
+                             group_by='ticker',
+                             threads=True,
+                             progress=False,
+                             session=self._session,
+                             **kwargs)
+
+            for symbol in group:
+                # yf.download returns a column-MultiIndex keyed by ticker when
+                # given multiple symbols, and a flat frame for a single one
+                symbol_df = df[symbol] if len(group) > 1 else df
+
+                # Only present with auto_adjust=False; Ticker.history frames
+                # never carry it, so drop it to keep one schema
+                symbol_df = symbol_df.drop(columns='Adj Close', errors='ignore')
+
+                symbol_df = self._normalize_history(symbol, symbol_df)
+                if symbol_df is not None:
+                    result[symbol] = symbol_df
+
+        return result
+
+    def _download_threaded(self,
+                          symbols: List[str],
+                          start_date: str,
+                          end_date: str,
+                          interval: str = '1d',
+                          max_workers: int = 16,
+                          **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Download symbols from Yahoo Finance one at a time on a thread pool.
+
+        The per-symbol fetches are pure network wait, so overlapping them
+        gives up to min(len(symbols), workers)x speedup over a serial loop.
+
+        Parameters
+        ----------
+        symbols : List[str]
+            List of ticker symbols to load
+        start_date : str
+            Start date for data in format 'YYYY-MM-DD'
+        end_date : str
+            End date for data in format 'YYYY-MM-DD'
+        interval : str, optional
+            Data interval, by default '1d'
+        max_workers : int, optional
+            Maximum thread count, by default 16
+        **kwargs : dict
+            Additional keyword arguments for Ticker.history
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Dictionary of DataFrames with symbols as keys
+        """
+        result = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            futures = {
+                executor.submit(self._fetch_one, symbol, start_date, end_date, interval, **kwargs): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol, df = future.result()
+                if df is not None:
+                    result[symbol] = df
+
+        return result
+
+    def _fetch_one(self,
+                  symbol: str,
+                  start_date: str,
+                  end_date: str,
+                  interval: str = '1d',
+                  **kwargs) -> Tuple[str, Optional[pd.DataFrame]]:
+        """
+        Fetch history for a single symbol from Yahoo Finance.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol to fetch
+        start_date : str
+            Start date for data in format 'YYYY-MM-DD'
+        end_date : str
+            End date for data in format 'YYYY-MM-DD'
+        interval : str, optional
+            Data interval, by default '1d'
+        **kwargs : dict
+            Additional keyword arguments for Ticker.history
+
+        Returns
+        -------
+        Tuple[str, Optional[pd.DataFrame]]
+            The symbol and its DataFrame, or None if the data was unusable
+        """
+        ticker = yf.Ticker(symbol, session=self._session)
+        df = ticker.history(start=start_date, end=end_date, interval=interval, **kwargs)
+        return symbol, self._normalize_history(symbol, df)
+
+    def _download_pipelined(self,
+                           symbols: List[str],
+                           start_date: str,
+                           end_date: str,
+                           interval: str = '1d',
+                           **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Download symbols with a single in-flight request, prefetched.
+
+        A producer thread keeps one download ahead of the consumer, so the
+        next symbol's network wait hides the current frame's normalization
+        work while never issuing more than one request at a time (rate-limit
+        friendly). The bounded queue keeps memory bounded.
+
+        Parameters
+        ----------
+        symbols : List[str]
+            List of ticker symbols to load
+        start_date : str
+            Start date for data in format 'YYYY-MM-DD'
+        end_date : str
+            End date for data in format 'YYYY-MM-DD'
+        interval : str, optional
+            Data interval, by default '1d'
+        **kwargs : dict
+            Additional keyword arguments for Ticker.history
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Dictionary of DataFrames with symbols as keys
+        """
+        pending = queue.Queue(maxsize=2)
+        errors = []
+
+        def producer():
+            # Always deliver the sentinel, even when a download raises;
+            # otherwise the consumer blocks on pending.get() forever
+            try:
+                for symbol in symbols:
+                    ticker = yf.Ticker(symbol, session=self._session)
+                    pending.put((symbol,
+                                 ticker.history(start=start_date, end=end_date,
+                                                interval=interval, **kwargs)))
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                pending.put(None)
+
+        threading.Thread(target=producer, daemon=True).start()
+
+        result = {}
+        while (item := pending.get()) is not None:
+            symbol, df = item
+            df = self._normalize_history(symbol, df)
+            if df is not None:
+                result[symbol] = df
+
+        if errors:
+            raise errors[0]
+
+        return result
+
+    @staticmethod
+    def _normalize_history(symbol: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Validate and standardize a raw Ticker.history frame.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol the frame belongs to
+        df : pd.DataFrame
+            Raw frame as returned by yfinance
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            Frame with lowercase OHLCV columns, or None if unusable
+        """
+        # Ensure the DataFrame has the required columns
+        if 'Open' not in df.columns or 'Close' not in df.columns:
+            logger.warning("Missing required columns for symbol %s", symbol)
+            return None
+
+        # Rename columns to standardized format
+        return df.rename(columns={
+            'Open': 'open',
+            'High': 'high',
+            'Low': 'low',
+            'Close': 'close',
+            'Volume': 'volume'
+        })
+
+    def _load_from_csv(self,
                       symbols: List[str],
                       directory: str = './data',
+                      price_dtype=np.float32,
                       **kwargs) -> Dict[str, pd.DataFrame]:
         """
         Load data from CSV files.
-        
+
         Parameters
         ----------
         symbols : List[str]
             List of ticker symbols to load
         directory : str, optional
             Directory containing CSV files, by default './data'
+        price_dtype : optional
+            Dtype for price columns, by default np.float32; pass
+            np.float64 for numerically sensitive work
         **kwargs : dict
             Additional keyword arguments for pd.read_csv
             
@@ -130,43 +556,174 @@ class DataLoader:
         Dict[str, pd.DataFrame]
             Dictionary of DataFrames with symbols as keys
         """
-        result = {}
+        # List the directory once instead of stat()ing per symbol; each
+        # stat is a round trip on networked filesystems
+        try:
+            present = {entry.name[:-4] for entry in os.scandir(directory)
+                       if entry.name.endswith('.csv')}
+        except FileNotFoundError:
+            present = set()
+
+        paths = {}
         for symbol in symbols:
             file_path = os.path.join(directory, f"{symbol}.csv")
-            if not os.path.exists(file_path):
-                print(f"Warning: File not found for symbol {symbol} at {file_path}")
+            if symbol not in present:
+                logger.warning("File not found for symbol %s at %s", symbol, file_path)
                 continue
-                
-            df = pd.read_csv(file_path, **kwargs)
-            
-            # Convert date column to datetime if it exists
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
-                df.set_index('date', inplace=True)
-            
-            # Ensure DataFrame has required columns
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                if col not in df.columns:
-                    print(f"Warning: Missing required column '{col}' for symbol {symbol}")
-                
-            result[symbol] = df
-            
+            paths[symbol] = file_path
+
+        # Parse files concurrently; the pandas C parser releases the GIL,
+        # so threads overlap disk reads with parsing
+        result = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(self._read_csv_file, symbol, path, **kwargs): symbol
+                for symbol, path in paths.items()
+            }
+            for future in as_completed(futures):
+                symbol, df = future.result()
+                result[symbol] = self._downcast_columns(df, price_dtype)
+
         self.data.update(result)
+        self._invalidate_returns_cache(result)
         return result
     
-    def _load_from_excel(self, 
+    @staticmethod
+    def _downcast_columns(df: pd.DataFrame, dtype=np.float32) -> pd.DataFrame:
+        """
+        Downcast OHLCV columns to narrower dtypes.
+
+        Equity prices fit comfortably in float32, which halves the bytes
+        moved by every downstream reduction. Volume is narrowed to int32
+        when its values allow it.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Frame with standardized OHLCV columns
+        dtype : optional
+            Target dtype for price columns, by default np.float32.
+            Pass np.float64 to keep full precision
+
+        Returns
+        -------
+        pd.DataFrame
+            The same frame with narrowed columns
+        """
+        price_cols = [col for col in ('open', 'high', 'low', 'close') if col in df.columns]
+        if price_cols:
+            df[price_cols] = df[price_cols].astype(dtype, copy=False)
+
+        if 'volume' in df.columns:
+            volume = df['volume']
+            if not volume.isna().any() and (volume.abs() < np.iinfo(np.int32).max).all():
+                df['volume'] = volume.astype(np.int32, copy=False)
+
+        return df
+
+    @staticmethod
+    def _parse_dates(values: pd.Series) -> pd.Series:
+        """
+        Convert a date column to datetime, fast-pathing ISO dates.
+
+        An explicit format skips pandas' per-value format inference and
+        cache=True dedupes repeated strings; non-ISO columns fall back to
+        inference.
+
+        Parameters
+        ----------
+        values : pd.Series
+            Raw date column
+
+        Returns
+        -------
+        pd.Series
+            Parsed datetime column
+        """
+        try:
+            return pd.to_datetime(values, format='%Y-%m-%d', cache=True)
+        except (ValueError, TypeError):
+            return pd.to_datetime(values, cache=True)
+
+    def _read_csv_file(self,
+                      symbol: str,
+                      file_path: str,
+                      **kwargs) -> Tuple[str, pd.DataFrame]:
+        """
+        Read and normalize a single symbol's CSV file.
+
+        Parameters
+        ----------
+        symbol : str
+            Ticker symbol the file belongs to
+        file_path : str
+            Path to the CSV file
+        **kwargs : dict
+            Additional keyword arguments for pd.read_csv
+
+        Returns
+        -------
+        Tuple[str, pd.DataFrame]
+            The symbol and its DataFrame
+        """
+        if kwargs.get('chunksize'):
+            # Stream the file in pieces and keep only the columns we use,
+            # bounding peak memory on very large histories. The pyarrow
+            # engine does not support chunked reads, so the C engine is
+            # used here
+            keep = ['date', 'open', 'high', 'low', 'close', 'volume']
+            pieces = []
+            for chunk in pd.read_csv(file_path, **kwargs):
+                columns = [col for col in keep if col in chunk.columns]
+                pieces.append(chunk[columns] if columns else chunk)
+            df = pd.concat(pieces, copy=False)
+        elif _HAS_PYARROW and not kwargs:
+            # Arrow's C++ reader parses on multiple threads and a large
+            # block size cuts the number of read syscalls while its
+            # readahead overlaps I/O with parsing
+            table = pa_csv.read_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20)
+            )
+            df = table.to_pandas(self_destruct=True)
+        else:
+            # Caller-supplied read_csv kwargs don't map onto the Arrow
+            # reader, so go through pandas, still preferring its pyarrow
+            # engine over the single-threaded C engine
+            if _HAS_PYARROW:
+                kwargs.setdefault('engine', 'pyarrow')
+
+            df = pd.read_csv(file_path, **kwargs)
+
+        # Convert date column to datetime if it exists
+        if 'date' in df.columns:
+            df['date'] = self._parse_dates(df['date'])
+            df.set_index('date', inplace=True)
+
+        # Ensure DataFrame has required columns
+        missing = _REQUIRED_COLUMNS.difference(df.columns)
+        if missing:
+            logger.warning("Missing required columns %s for symbol %s", sorted(missing), symbol)
+
+        return symbol, df
+
+    def _load_from_excel(self,
                         symbols: List[str],
                         file_path: str,
+                        price_dtype=np.float32,
                         **kwargs) -> Dict[str, pd.DataFrame]:
         """
         Load data from Excel file with multiple sheets.
-        
+
         Parameters
         ----------
         symbols : List[str]
             List of ticker symbols to load (should match sheet names)
         file_path : str
             Path to Excel file
+        price_dtype : optional
+            Dtype for price columns, by default np.float32; pass
+            np.float64 for numerically sensitive work
         **kwargs : dict
             Additional keyword arguments for pd.read_excel
             
@@ -178,30 +735,54 @@ class DataLoader:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Excel file not found: {file_path}")
             
+        # Open the workbook once and parse all requested sheets in a single
+        # pass, instead of re-reading the zip container per symbol. An
+        # engine kwarg must go to ExcelFile, not read_excel, which rejects
+        # it when handed an already-open workbook
+        engine = kwargs.pop('engine', None)
+        with pd.ExcelFile(file_path, engine=engine) as workbook:
+            available = [symbol for symbol in symbols if symbol in workbook.sheet_names]
+            for symbol in symbols:
+                if symbol not in workbook.sheet_names:
+                    logger.warning("Sheet not found for symbol %s", symbol)
+
+            sheets = pd.read_excel(workbook, sheet_name=available, **kwargs) if available else {}
+
         result = {}
-        for symbol in symbols:
-            try:
-                df = pd.read_excel(file_path, sheet_name=symbol, **kwargs)
-                
-                # Convert date column to datetime if it exists
-                if 'date' in df.columns:
-                    df['date'] = pd.to_datetime(df['date'])
-                    df.set_index('date', inplace=True)
-                
-                result[symbol] = df
-            except Exception as e:
-                print(f"Error loading sheet for symbol {symbol}: {e}")
-                
+        for symbol, df in sheets.items():
+            # Convert date column to datetime if it exists
+            if 'date' in df.columns:
+                df['date'] = self._parse_dates(df['date'])
+                df.set_index('date', inplace=True)
+
+            result[symbol] = self._downcast_columns(df, price_dtype)
+
         self.data.update(result)
+        self._invalidate_returns_cache(result)
         return result
     
-    def calculate_returns(self, 
+    def _invalidate_returns_cache(self, symbols) -> None:
+        """
+        Drop memoized return series for symbols whose data was replaced.
+
+        Parameters
+        ----------
+        symbols : iterable of str
+            Symbols whose cached returns are no longer valid
+        """
+        stale = set(symbols)
+        self._returns_cache = {
+            key: series for key, series in self._returns_cache.items()
+            if key[0] not in stale
+        }
+
+    def calculate_returns(self,
                          symbols: List[str] = None, 
                          period: int = 1,
-                         method: str = 'simple') -> Dict[str, pd.DataFrame]:
+                         method: str = 'simple') -> Mapping[str, pd.DataFrame]:
         """
         Calculate returns for the loaded data.
-        
+
         Parameters
         ----------
         symbols : List[str], optional
@@ -210,33 +791,199 @@ class DataLoader:
             Period for return calculation, by default 1
         method : str, optional
             Return calculation method ('simple' or 'log'), by default 'simple'
-            
+
         Returns
         -------
-        Dict[str, pd.DataFrame]
-            Dictionary of DataFrames with returns added
+        Mapping[str, pd.DataFrame]
+            Read-only view of the DataFrames with returns added
         """
-        if symbols is None:
+        all_symbols = symbols is None
+        if all_symbols:
             symbols = list(self.data.keys())
-            
+
+        method = method.lower()
+        if method not in ('simple', 'log'):
+            raise ValueError(f"Unsupported return calculation method: {method}")
+
+        to_compute = []
         for symbol in symbols:
             if symbol not in self.data:
-                print(f"Warning: No data loaded for symbol {symbol}")
+                logger.warning("No data loaded for symbol %s", symbol)
                 continue
-                
-            df = self.data[symbol].copy()
-            
-            if method.lower() == 'simple':
-                df['return'] = df['close'].pct_change(period)
-            elif method.lower() == 'log':
-                df['return'] = np.log(df['close'] / df['close'].shift(period))
+
+            # Serve repeat calls from the memo; entries are invalidated
+            # whenever a loader replaces the symbol's data
+            cached = self._returns_cache.get((symbol, period, method))
+            if cached is not None:
+                self.data[symbol]['return'] = cached
             else:
-                raise ValueError(f"Unsupported return calculation method: {method}")
-                
-            self.data[symbol] = df
-            
-        return {symbol: self.data[symbol] for symbol in symbols}
+                to_compute.append(symbol)
+
+        # Group symbols sharing an identical index: concatenating mixed
+        # calendars would align on the union, padding rows a symbol never
+        # had and shifting what 'period' rows means for it
+        groups = []
+        for symbol in to_compute:
+            index = self.data[symbol].index
+            for group_index, members in groups:
+                if index.equals(group_index):
+                    members.append(symbol)
+                    break
+            else:
+                groups.append((index, [symbol]))
+
+        for group_index, members in groups:
+            # Stack closes into one (T, N) frame so the return kernel runs
+            # once over a contiguous block instead of once per symbol
+            closes = pd.concat({s: self.data[s]['close'] for s in members}, axis=1)
+
+            if method == 'simple':
+                rets = closes.pct_change(period)
+            elif _HAS_NUMBA:
+                values = closes.to_numpy(dtype=np.float64)
+                out = np.empty_like(values)
+                _log_returns(values, period, out)
+                rets = pd.DataFrame(out, index=closes.index, columns=closes.columns)
+            else:
+                rets = np.log(closes).diff(period)
+
+            for symbol in members:
+                df = self.data[symbol]
+                df['return'] = rets[symbol]
+                self._returns_cache[(symbol, period, method)] = df['return']
+
+        # Hand back a read-only view instead of copying into a fresh dict;
+        # callers only iterate the result
+        if all_symbols:
+            return MappingProxyType(self.data)
+        return MappingProxyType({symbol: self.data[symbol] for symbol in symbols
+                                 if symbol in self.data})
     
+    def save_cache(self, path: str = '.cache/loader.parquet') -> str:
+        """
+        Persist all loaded data to a single parquet file.
+
+        Writing one columnar file after an expensive CSV/Excel/network
+        load lets later runs restore the whole dataset in one vectorized
+        read via the 'parquet_cache' source.
+
+        Parameters
+        ----------
+        path : str, optional
+            Destination file, by default '.cache/loader.parquet'
+
+        Returns
+        -------
+        str
+            The path written to
+        """
+        if not _HAS_PYARROW:
+            raise ImportError("pyarrow is required to write the parquet cache")
+        if not self.data:
+            raise ValueError("No data loaded to save")
+
+        combined = pd.concat(
+            [df.assign(symbol=symbol) for symbol, df in self.data.items()],
+            copy=False
+        )
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        combined.to_parquet(path)
+        return path
+
+    def _load_from_parquet_cache(self,
+                                symbols: List[str] = None,
+                                path: str = '.cache/loader.parquet',
+                                **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        Restore data previously written by save_cache.
+
+        Parameters
+        ----------
+        symbols : List[str], optional
+            Symbols to restore, by default None (all symbols in the file)
+        path : str, optional
+            Parquet file written by save_cache, by default
+            '.cache/loader.parquet'
+        **kwargs : dict
+            Additional keyword arguments for pd.read_parquet
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Dictionary of DataFrames with symbols as keys
+        """
+        if not _HAS_PYARROW:
+            raise ImportError("pyarrow is required to read the parquet cache")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Parquet cache not found: {path}")
+
+        combined = pd.read_parquet(path, **kwargs)
+
+        result = {}
+        for symbol, df in combined.groupby('symbol', sort=False):
+            if symbols is None or symbol in symbols:
+                result[symbol] = df.drop(columns='symbol')
+
+        if symbols is not None:
+            for symbol in symbols:
+                if symbol not in result:
+                    logger.warning("Symbol %s not found in parquet cache %s", symbol, path)
+
+        self.data.update(result)
+        self._invalidate_returns_cache(result)
+        return result
+
+    def build_matrix(self,
+                    symbols: List[str] = None,
+                    fields: Tuple[str, ...] = ('open', 'high', 'low', 'close', 'volume'),
+                    dtype=np.float32) -> Dict[str, np.ndarray]:
+        """
+        Build a structure-of-arrays view of the loaded data.
+
+        Backtests replay timestep-by-timestep across all symbols, which is
+        cache-hostile on a dict of per-symbol DataFrames. This builds one
+        contiguous (T, N) array per field so matrix['close'][t, i] scans
+        stride-1 over symbols at a fixed timestep. The result is stored on
+        self.matrix along with self.symbols and self.timestamps.
+
+        Parameters
+        ----------
+        symbols : List[str], optional
+            Symbols to include, by default None (all loaded symbols)
+        fields : Tuple[str, ...], optional
+            Columns to extract, by default OHLCV
+        dtype : optional
+            Array dtype, by default np.float32 (halves bytes moved
+            versus float64)
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Mapping of field name to (T, N) array
+        """
+        if symbols is None:
+            symbols = list(self.data.keys())
+
+        # Union of all symbol indexes so every array shares one time axis
+        index = None
+        for symbol in symbols:
+            symbol_index = self.data[symbol].index
+            index = symbol_index if index is None else index.union(symbol_index)
+
+        self.symbols = list(symbols)
+        self.timestamps = index.values if index is not None else None
+        self.matrix = {}
+        for field in fields:
+            wide = pd.DataFrame(
+                {symbol: self.data[symbol][field].reindex(index) for symbol in symbols},
+                index=index
+            )
+            self.matrix[field] = np.ascontiguousarray(wide.values, dtype=dtype)
+
+        return self.matrix
+
     def get_data(self, symbol: str) -> pd.DataFrame:
         """
         Get data for a specific symbol.